@@ -31,6 +31,7 @@ class Encoder(ABC):
         self.setOfEncodedPackets: typing.Set[int] = set()
         self.encodedPackets: typing.Set[RU10Packet] = set()
         self.overhead_limit: typing.Optional[float] = None
+        self.padding_seed: typing.Optional[int] = None
         self.chunks = []
         self.error_correction: typing.Callable = nocode
         self.progress_bar = None
@@ -50,6 +51,10 @@ class Encoder(ABC):
     def set_overhead_limit(self, n: float):
         self.overhead_limit = n
 
+    def set_padding_seed(self, seed: int):
+        # encoders sharing one packet pool must pad the last chunk identically
+        self.padding_seed = seed
+
     def encode_file(self, split_to_multiple_files: bool = False):
         pass  # implemented in subclasses
 
@@ -102,7 +107,11 @@ class Encoder(ABC):
         assert (len(last) <= self.chunk_size), "Error, last Chunk ist bigger than ChunkSize"
         if len(last) < self.chunk_size:
             if self.insert_header:
-                filler = b"\x00" + os.urandom(self.chunk_size - len(last) - 1)
+                pad_len = self.chunk_size - len(last) - 1
+                if self.padding_seed is None:
+                    filler = b"\x00" + os.urandom(pad_len)
+                else:
+                    filler = b"\x00" + np.random.default_rng(self.padding_seed).bytes(pad_len)
             else:
                 filler = (self.chunk_size - len(last)) * b"\x00"
             struct_str = "<" + str(len(last)) + "s" + str(self.chunk_size - len(last)) + "s"
@@ -178,12 +187,16 @@ class Encoder(ABC):
             for packet in self.encodedPackets:
                 if seed_is_filename:
                     i = packet.id
-                e_prob = (str(ceil(packet.error_prob * 100)) + "_") if packet.error_prob is not None else ""
-                f.write(">" + e_prob + str(i) + file_ending + "\n" + packet.get_dna_struct(True) + "\n")
+                f.write(self.get_fasta_record(packet, i, file_ending))
                 i += 1
         print(f"\nSaved result at: %s" % out_file)
         return out_file
 
+    @staticmethod
+    def get_fasta_record(packet, i, file_ending="") -> str:
+        e_prob = (str(ceil(packet.error_prob * 100)) + "_") if packet.error_prob is not None else ""
+        return ">" + e_prob + str(i) + file_ending + "\n" + packet.get_dna_struct(True) + "\n"
+
     @staticmethod
     def translate_to_bytes(bit_arr, img):
         width, height = img.size
@@ -78,6 +78,8 @@ class RU10Encoder(Encoder):
         self.id_spacing = id_spacing
         self.oligoLen = None
         self.priority_chunks = None
+        self.encode_shares: int = 1
+        self.encode_share: int = 0
 
     """ 
     Creates Chunks from the given File, fills last Chunk with padding, 
@@ -122,6 +124,18 @@ class RU10Encoder(Encoder):
         """
         self.priority_chunks = priority_chunks
 
+    def set_encode_shares(self, shares: int, share: int = 0):
+        """
+        Splits the packet target of do_encode and the ID space into the given number of shares and only generates
+        one of them, using IDs congruent to share modulo shares. Several encoders can thus generate one packet pool
+        in parallel without ever drawing the same ID.
+        :param shares: Number of encoders sharing the packet target
+        :param share: Index of the share this encoder generates
+        :return:
+        """
+        self.encode_shares = max(1, shares)
+        self.encode_share = share % self.encode_shares
+
     def do_encode(self):
         """
         If a pseudodecoder is used packets will be generated until the pseudodecoder would be able to decode the file.
@@ -154,8 +168,11 @@ class RU10Encoder(Encoder):
                 _encode(pseudo=True)
         else:
             count = 0
-            while (self.number_of_packets_encoded_already() < (self.number_of_chunks + (
-                    self.number_of_chunks * self.overhead_limit)) or self.number_of_packets_encoded_already() < self.number_of_chunks):  # % Aufschlag
+            target = ceil(max(self.number_of_chunks + (self.number_of_chunks * self.overhead_limit),
+                              self.number_of_chunks))  # % Aufschlag
+            # this encoder's part of the target, the remainder goes to the first shares
+            target = target // self.encode_shares + (self.encode_share < target % self.encode_shares)
+            while self.number_of_packets_encoded_already() < target:
                 # This process continues until the receiver signals that the
                 # message has been received and successfully decoded.
                 _encode(pseudo=False, count=count)
@@ -175,6 +192,10 @@ class RU10Encoder(Encoder):
             random_generator = self.random_state
         # RU10 is only defined for max int31!
         max_num = min(Encoder.calc_max_size(struct.calcsize("<" + self.id_len_format)), int31)
+        if self.encode_shares > 1:
+            # stay within this share's residue class of the ID space
+            k = random_generator.randint(0, ceil((max_num - self.encode_share) / self.encode_shares), dtype=np.uint32)
+            return np.uint32(self.encode_share + self.encode_shares * int(k))
         return random_generator.randint(0, max_num, dtype=np.uint32)
 
     def create_new_packet(self, systematic: bool = False, seed: typing.Optional[int] = None) -> RU10Packet:
@@ -4,6 +4,7 @@ import logging
 import struct
 import typing
 import numpy as np
+from functools import lru_cache
 
 from norec4dna.helper import xor_mask
 from norec4dna.Packet import Packet
@@ -14,6 +15,12 @@ from norec4dna.distributions.RaptorDistribution import RaptorDistribution
 from norec4dna.ErrorCorrection import nocode
 
 
+@lru_cache(maxsize=None)
+def header_struct(fmt: str) -> struct.Struct:
+    # packets of one encoder share their header formats - compile each once
+    return struct.Struct("<" + fmt)
+
+
 class RU10Packet(Packet):
     def __init__(self, data, used_packets: typing.Collection[int], total_number_of_chunks, id, dist=None,
                  read_only=False,
@@ -80,11 +87,11 @@ class RU10Packet(Packet):
         # Format = Highest possible Packetnumber for this file,
         # number of used Packets for this File and the seed for the Indices of the used Packets
         if self.save_number_of_chunks_in_packet:
-            return struct.pack("<" + self.number_of_chunks_len_format + self.id_len_format,
-                               xor_mask(self.total_number_of_chunks, self.number_of_chunks_len_format),
-                               xor_mask(self.id, self.id_len_format, enabled=self.mask_id))
+            return header_struct(self.number_of_chunks_len_format + self.id_len_format).pack(
+                xor_mask(self.total_number_of_chunks, self.number_of_chunks_len_format),
+                xor_mask(self.id, self.id_len_format, enabled=self.mask_id))
         else:
-            return struct.pack("<" + self.id_len_format, xor_mask(self.id, self.id_len_format, enabled=self.mask_id))
+            return header_struct(self.id_len_format).pack(xor_mask(self.id, self.id_len_format, enabled=self.mask_id))
 
     def packMethod(self) -> bytes:
         if "window" not in self.method:
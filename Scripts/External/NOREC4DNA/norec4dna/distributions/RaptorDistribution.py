@@ -516,6 +516,17 @@ class RaptorDistribution(Distribution):
         self.d: np.ndarray = np.array([0, 1, 2, 3, 4, 10, 11, 40], dtype=np.int8)
         self.p_thr: float = p_thr
 
+    @property
+    def f(self) -> np.ndarray:
+        return self._f
+
+    @f.setter
+    def f(self, f: np.ndarray):
+        # the optimizers swap in their own CDF, so refresh the plain-number copy on every assignment:
+        # bisect on an ndarray boxes a numpy scalar per comparison
+        self._f = f
+        self._f_bounds: typing.Tuple[float, ...] = tuple(np.asarray(f).tolist())
+
     @lru_cache(8192)
     def smallestPrimeGreaterOrEqual(self, x: int) -> int:
         if x <= self.smallPrimes[len(self.smallPrimes) - 1]:
@@ -561,7 +572,7 @@ class RaptorDistribution(Distribution):
         if self.rng.random() < self.p_thr:
             return 1
         try:
-            return self.d[bisect.bisect_right(self.f, v)]
+            return self.d[bisect.bisect_right(self._f_bounds, v)]
         except IndexError:
             return self.d[-1]
 
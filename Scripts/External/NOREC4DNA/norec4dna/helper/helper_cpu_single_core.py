@@ -2,7 +2,7 @@
 # -*- coding: latin-1 -*-
 from random import random
 import zlib, numpy
-from functools import reduce, lru_cache
+from functools import lru_cache
 import typing
 from crccheck.crc import Crc8Lte as crc8
 from crccheck.crc import Crc32, Crc16, Crc64
@@ -27,11 +27,16 @@ def xor_numpy_old(p1, p2):
 
 
 def listXOR(plist):
-    return reduce(xor_numpy, plist)
+    # one vectorised reduction over the stacked payloads instead of a pairwise python reduce
+    if len(plist) == 1:
+        return plist[0]
+    return numpy.bitwise_xor.reduce(numpy.asarray(plist, dtype=numpy.uint8), axis=0)
 
 
 def logical_xor(plist):
-    return reduce(numpy.logical_xor, plist)
+    if len(plist) == 1:
+        return plist[0]
+    return numpy.logical_xor.reduce(numpy.asarray(plist, dtype=bool), axis=0)
 
 
 def xor_pakets(packet1, packet2):
@@ -64,6 +69,11 @@ def calc_crc(data, crc_len_format="B") -> int:
         raise ValueError("Unknown crc_len_format: " + str(crc_len_format))
 
 
+_XOR_MASKS = {"H": 0b1111100111000011,
+              "I": 0b11111001110000110110111110011100,
+              "Q": 0b1111100111000011011011111001110011111001110000110110111110011100}
+
+
 @lru_cache(maxsize=1024)
 def xor_mask(data: typing.Union[int, float, bytes, numpy.ndarray, typing.Iterable], len_format: str = "I",
              mask: int = 0b11111001110000110110111110011100, enabled=True):
@@ -71,12 +81,10 @@ def xor_mask(data: typing.Union[int, float, bytes, numpy.ndarray, typing.Iterabl
         return data
     if len_format == "B":
         return data
-    if len_format == "H":
-        mask = 0b1111100111000011
-    if len_format == "I":
-        mask = 0b11111001110000110110111110011100
-    if len_format == "Q":
-        mask = 0b1111100111000011011011111001110011111001110000110110111110011100
+    mask = _XOR_MASKS.get(len_format, mask)
+    if isinstance(data, (int, numpy.integer)):
+        # ids and counts are scalars: plain int xor avoids ufunc dispatch and the errstate context per packet
+        return int(data) ^ mask
     with numpy.errstate(over="ignore"):
         return numpy.bitwise_xor(data, mask)
 
@@ -8,6 +8,15 @@ T = 3
 import typing
 from io import BytesIO
 
+import numpy as np
+from numba import njit
+
+# (ASCII code << 8 | ASCII code) -> 4-bit value of the nucleotide pair, 0xFF if invalid
+QUAT_PAIR_LUT = np.full(65536, 0xFF, dtype=np.uint8)
+for _i, _a in enumerate(b"ACGT"):
+    for _j, _b in enumerate(b"ACGT"):
+        QUAT_PAIR_LUT[(_a << 8) | _b] = (_i << 2) | _j
+
 
 def quaternary_to_bin(filename: str) -> None:
     with open(filename, "r") as f:
@@ -44,11 +53,32 @@ def quats_to_bytes(quats: typing.AnyStr) -> bytes:
 
 
 
+@njit(cache=True)
+def _pack_quats(seq, pair_lut, out):
+    # packs four nucleotides per output byte, first nucleotide in the high bits;
+    # two table lookups per byte, one per nucleotide pair
+    for j in range(out.shape[0]):
+        i = 4 * j
+        hi = pair_lut[(np.uint16(seq[i]) << 8) | seq[i + 1]]
+        lo = pair_lut[(np.uint16(seq[i + 2]) << 8) | seq[i + 3]]
+        if hi == 0xFF or lo == 0xFF:
+            return False
+        out[j] = (hi << 4) | lo
+    return True
+
+
+def dna_to_bytes(dna: typing.Union[str, bytes]) -> bytes:
+    raw = dna.encode("ascii") if isinstance(dna, str) else bytes(dna)
+    if len(raw) % 4 != 0:
+        raise ValueError("DNA length must be a multiple of 4, got " + str(len(raw)))
+    out = np.empty(len(raw) // 4, dtype=np.uint8)
+    if not _pack_quats(np.frombuffer(raw, dtype=np.uint8), QUAT_PAIR_LUT, out):
+        raise ValueError("ERROR, this should never happen. Does your inputfile contain characters other than A,C,G,T?")
+    return out.tobytes()
+
+
 def tranlate_quat_to_byte(in_txt):
-    out = b''
-    for i in range(0, len(in_txt), 4):
-        out += quats_to_bytes(in_txt[i:i + 4])
-    return out
+    return dna_to_bytes(in_txt)
 
 
 def get_quarter_byte(quat: str) -> int:
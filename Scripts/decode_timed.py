@@ -25,45 +25,172 @@ tried—useful for tracking down yet‑another naming change.
 from __future__ import annotations
 
 import argparse
-import random
-import csv
 import time
 import inspect
+from array import array
+from collections.abc import Sized
 from pathlib import Path
-from typing import Dict, List, Sequence, Callable, Any
+from typing import Dict, List, Sequence, Callable, Any, BinaryIO
 
-from Bio import SeqIO  # pip install biopython
+import numpy as np
 
-# NOREC4DNA ---------------------------------------------------------------
-from norec4dna.RU10Decoder import RU10Decoder  # direct import still works for the base class
+# NOREC4DNA is imported where a decoder is built: it pulls in numba/scipy,
+# which would otherwise make even ``--help`` slow.
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Dynamic method discovery helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
+_METHOD_CACHE: Dict[tuple, str] = {}
+
+
+def _positional_arity(fn: Any) -> int | None:
+    """Return # positional parameters of a class attribute, ``self`` excluded.
+
+    ``None`` means the code object cannot tell – e.g. builtins, or decorated
+    functions whose real signature sits behind ``__wrapped__``.
+    """
+    if isinstance(fn, staticmethod):
+        fn = fn.__func__
+        if hasattr(fn, "__wrapped__"):
+            return None
+        code = getattr(fn, "__code__", None)
+        return None if code is None else code.co_argcount
+    if isinstance(fn, classmethod):
+        fn = fn.__func__
+    if hasattr(fn, "__wrapped__"):
+        return None
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return None
+    return code.co_argcount - 1
+
+
+def _wants_bytes(fn: Callable) -> bool:
+    """True if *fn*'s first argument is annotated as ``bytes``."""
+    fn = inspect.unwrap(getattr(fn, "__func__", fn))
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return False
+    names = code.co_varnames[:code.co_argcount]
+    if names and names[0] == "self":
+        names = names[1:]
+    if not names:
+        return False
+    ann = getattr(fn, "__annotations__", {}).get(names[0])
+    return ann is bytes or ann == "bytes"
+
+
 def _find_method(obj: Any, wanted_prefixes: Sequence[str], *, min_arity: int = 1) -> Callable:
     """Return the first callable whose name matches a prefix and arity.
 
     *prefixes*   – list/tuple of allowed name prefixes (e.g. ("add_", "push_"))
-    *min_arity*  – minimum # positional parameters *excluding* ``self``
+    *min_arity*  – minimum # positional parameters *excluding* ``self``
+
+    Candidates are tried in ``dir()`` order.  A method found on the class is
+    cached per ``(type, prefixes, min_arity)``; callables bound on the instance
+    (wrappers doing ``self.add_packet = inner.add_packet``) are never cached.
     """
+    key = (type(obj), tuple(wanted_prefixes), min_arity)
+    name = _METHOD_CACHE.get(key)
+    if name is not None:
+        return getattr(obj, name)
+
+    class_attrs: Dict[str, Any] = {}
+    for cls in reversed(type(obj).__mro__):
+        class_attrs.update(cls.__dict__)
+    instance_attrs = getattr(obj, "__dict__", {})
+
     for name in dir(obj):
-        if any(name.startswith(p) for p in wanted_prefixes):
-            fn = getattr(obj, name)
-            if callable(fn):
-                sig = inspect.signature(fn)
-                # Exclude *only* the implicit "self" parameter
-                pos_args = [p for p in sig.parameters.values()
-                            if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
-                if len(pos_args) - 1 >= min_arity:
-                    return fn
+        if not any(name.startswith(p) for p in wanted_prefixes):
+            continue
+        on_class = name in class_attrs and name not in instance_attrs
+        arity = _positional_arity(class_attrs[name]) if on_class else None
+        if arity is None:
+            # instance attributes, wrapped functions, builtins and C extensions –
+            # ask inspect, which follows __wrapped__
+            bound = getattr(obj, name, None)
+            if not callable(bound):
+                continue
+            try:
+                sig = inspect.signature(bound)
+            except (TypeError, ValueError):
+                continue
+            arity = sum(1 for p in sig.parameters.values()
+                        if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD))
+        if arity >= min_arity:
+            if on_class:
+                _METHOD_CACHE[key] = name
+            return getattr(obj, name)
     raise AttributeError("No matching method found.")
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# FASTA reader
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _index_fasta(path: Path) -> array:
+    """Return the byte offset of every ``>`` header line in *path*.
+
+    Only the offsets are kept in memory; sequences are read on demand by
+    :func:`_read_sequence`, so records after an early stop are never loaded.
+    """
+    offsets = array("Q")
+    pos = 0
+    with open(path, "rb") as fh:
+        for line in fh:
+            if line[:1] == b">":
+                offsets.append(pos)
+            pos += len(line)
+    return offsets
+
+
+def _read_sequence(fh: BinaryIO, offset: int) -> bytes:
+    """Read the (possibly multi-line) sequence of the record at *offset*."""
+    fh.seek(offset)
+    fh.readline()  # header
+    parts: List[bytes] = []
+    while True:
+        line = fh.readline()
+        if not line or line[:1] == b">":
+            break
+        parts.append(line.strip())
+    return b"".join(parts)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Core routine
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Waits shorter than this are below the OS scheduling quantum; defer them.
+_MIN_SLEEP = 5e-4
+
+
+def _grow(bits: np.ndarray, size: int) -> np.ndarray:
+    """Return *bits* zero-extended to at least *size* entries."""
+    if len(bits) >= size:
+        return bits
+    grown = np.zeros(max(size, 2 * len(bits)), dtype=bool)
+    grown[:len(bits)] = bits
+    return grown
+
+
+def _chunks_kind(chunks: Any) -> str:
+    """Classify a decoded-chunk report so the loop can pick its diff path.
+
+    A set is diffed directly; a membership bitmap or a list of indices goes
+    through our own boolean bitmap so no Python set is ever built from it.
+    Iterators and generators have no len(), so they are listed every round.
+    """
+    if isinstance(chunks, (set, frozenset)):
+        return "set"
+    if isinstance(chunks, bytearray) or (isinstance(chunks, np.ndarray) and chunks.dtype == bool):
+        return "bitmap"
+    if not isinstance(chunks, Sized):
+        return "iterator"
+    return "indices"
+
+
 def decode_stream(
     fasta_path: Path,
     config_path: Path,
@@ -73,10 +200,11 @@ def decode_stream(
 ) -> Dict[int, int]:
     """Return mapping `chunk_idx → first_packet_seen`."""
 
-    packets = list(SeqIO.parse(str(fasta_path), "fasta"))
-    if seed is not None:
-        random.seed(seed)
-    random.shuffle(packets)
+    offsets = _index_fasta(fasta_path)
+    # Draw the sampling order over record offsets; sequences are fetched lazily.
+    order = np.random.default_rng(seed).permutation(len(offsets))
+
+    from norec4dna.RU10Decoder import RU10Decoder  # direct import still works for the base class
 
     decoder = RU10Decoder(str(config_path))
 
@@ -111,23 +239,67 @@ def decode_stream(
     except AttributeError:
         is_done = lambda: False  # keep feeding until packets exhausted
 
-    first_seen: Dict[int, int] = {}
-    prev_decoded: set[int] = set()
-
-    for pkt_no, rec in enumerate(packets, 1):
-        ingest(str(rec.seq))
-
-        current_decoded = set(get_chunks())
-        newly = current_decoded - prev_decoded
-        for idx in newly:
-            first_seen.setdefault(idx, pkt_no)
-        prev_decoded = current_decoded
+    # Records are read as bytes; only decode them if ingest wants text.
+    as_bytes = _wants_bytes(ingest)
 
-        if sleep > 0:
-            time.sleep(sleep)
+    # Bind locals once – the loop below runs once per oligo.  The kind of
+    # chunk report is settled on the first post-ingest call (see _chunks_kind).
+    ingest_local = ingest
+    get_chunks_local = get_chunks
+    is_done_local = is_done
+    chunks_kind: str | None = None
+    seen_bits = np.zeros(0, dtype=bool)
 
-        if is_done():
-            break
+    first_seen: Dict[int, int] = {}
+    # Diff against the keys we already recorded rather than a private copy:
+    # a decoder may return its own live set, which would alias ``prev``.
+    prev_decoded = first_seen.keys()
+    prev_len = 0
+
+    with open(fasta_path, "rb") as fh:
+        deadline = time.perf_counter()
+        for pkt_no, i in enumerate(order, 1):
+            seq = _read_sequence(fh, offsets[i])
+            ingest_local(seq if as_bytes else seq.decode("ascii"))
+
+            # Most packets unlock nothing – only diff when the count moved.
+            current_decoded = get_chunks_local()
+            if chunks_kind is None:
+                chunks_kind = _chunks_kind(current_decoded)
+            if chunks_kind == "bitmap":
+                current_decoded = np.asarray(current_decoded).astype(bool, copy=False)
+                cur_len = int(np.count_nonzero(current_decoded))
+            else:
+                if chunks_kind == "iterator":
+                    current_decoded = list(current_decoded)
+                cur_len = len(current_decoded)
+            if cur_len != prev_len:
+                if chunks_kind == "set":
+                    newly = current_decoded - prev_decoded
+                else:
+                    if chunks_kind == "bitmap":
+                        seen_bits = _grow(seen_bits, len(current_decoded))
+                        new_idx = np.flatnonzero(current_decoded & ~seen_bits[:len(current_decoded)])
+                    else:
+                        idx = np.fromiter(current_decoded, dtype=np.intp, count=cur_len)
+                        seen_bits = _grow(seen_bits, int(idx.max()) + 1 if cur_len else 0)
+                        new_idx = idx[~seen_bits[idx]]
+                    seen_bits[new_idx] = True
+                    newly = new_idx.tolist()
+                # ``newly`` excludes every recorded key, so a bulk insert is safe
+                first_seen.update(dict.fromkeys(newly, pkt_no))
+                prev_len = cur_len
+
+            if sleep > 0:
+                # Pace against an absolute deadline; sub-quantum waits are carried
+                # over and paid in one go, so drift never accumulates.
+                deadline += sleep
+                remaining = deadline - time.perf_counter()
+                if remaining > _MIN_SLEEP:
+                    time.sleep(remaining)
+
+            if is_done_local():
+                break
 
     return first_seen
 
@@ -135,6 +307,10 @@ def decode_stream(
 # CLI front‑end
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Large write buffer: one syscall per MiB of CSV instead of per 8 KiB.
+_CSV_BUFFER = 1 << 20
+
+
 def main() -> None:
     ap = argparse.ArgumentParser(
         prog="sequential_decode.py",
@@ -155,6 +331,7 @@ def main() -> None:
     except RuntimeError as err:
         # Emit the decoder's public API to help the user adapt the prefix lists
         import pprint, textwrap
+        from norec4dna.RU10Decoder import RU10Decoder
         decoder = RU10Decoder(str(opt.config))
         methods = [m for m in dir(decoder) if callable(getattr(decoder, m)) and not m.startswith("__")]
         print("\n[!] " + str(err))
@@ -163,11 +340,10 @@ def main() -> None:
         print("\nEdit *sequential_decode.py* and add the correct prefix to _find_method().")
         return
 
-    with opt.out.open("w", newline="") as fh:
-        writer = csv.writer(fh)
-        writer.writerow(["chunk_idx", "first_packet"])
-        for idx in sorted(mapping):
-            writer.writerow([idx, mapping[idx]])
+    # Two integer columns need no quoting – skip the csv module entirely.
+    rows = [f"{idx},{mapping[idx]}\n" for idx in sorted(mapping)]
+    with opt.out.open("w", newline="", buffering=_CSV_BUFFER) as fh:
+        fh.writelines(["chunk_idx,first_packet\n", *rows])
 
     recovered = len(mapping)
     horizon = max(mapping.values()) if mapping else 0
@@ -28,13 +28,15 @@ and ``thr_0``.
 from __future__ import annotations
 
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from norec4dna.Encoder import Encoder
-from norec4dna.RU10Encoder import RU10Encoder
-from norec4dna.ErrorCorrection import nocode, get_error_correction_encode
-from norec4dna.rules.FastDNARules import FastDNARules
-from norec4dna.distributions.RaptorDistribution import RaptorDistribution
+# NOREC4DNA is imported inside the functions that need it: it pulls in
+# numba/scipy, which would otherwise make even ``--help`` slow.
+if TYPE_CHECKING:
+    from norec4dna.RU10Encoder import RU10Encoder
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Constants mirroring RU10Encoder defaults
@@ -48,11 +50,100 @@ DEFAULT_CHUNK_SIZE = 71             # keeps oligos ≤ 150 nt by default
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+def _make_encoder(
+    file_path: Path,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    error_correction: str = "nocode",
+    repair_symbols: int = 2,
+    insert_header: bool = False,
+    save_number_of_chunks_in_packet: bool = False,
+    mode_1_bmp: bool = False,
+    prepend: str = "",
+    append: str = "",
+    upper_bound: float = 0.5,
+    overhead: float = 0.40,
+    checksum_len_str: str | None = None,
+    xor_by_seed: bool = False,
+    mask_id: bool = True,
+    id_spacing: int = 0,
+    priority_first: int = 0,
+    p_thr: float = 0.0,
+) -> RU10Encoder:
+    """Build a configured (but not yet run) RU10Encoder; see ``_encode``."""
+    from norec4dna.Encoder import Encoder
+    from norec4dna.RU10Encoder import RU10Encoder
+    from norec4dna.ErrorCorrection import get_error_correction_encode
+    from norec4dna.rules.FastDNARules import FastDNARules
+    from norec4dna.distributions.RaptorDistribution import RaptorDistribution
+
+    # determine number of chunks for the given chunk size
+    number_of_chunks = Encoder.get_number_of_chunks_for_file_with_chunk_size(
+        file_path, chunk_size
+    )
+
+    # Instantiate a Raptor distribution.  The distribution itself does not
+    # interpret the bias parameters directly; they will be passed through
+    # to the decoder via the configuration file.
+    dist = RaptorDistribution(number_of_chunks, p_thr=p_thr)
+    rules = FastDNARules()
+
+    # ⚠  RU10Encoder internally does str-concat on its ``file`` attribute,
+    #     so we hand it a plain string instead of a Path.
+    enc = RU10Encoder(
+        str(file_path),
+        number_of_chunks,
+        dist,
+        insert_header=insert_header,
+        pseudo_decoder=None,
+        chunk_size=0,  # let encoder derive from number_of_chunks
+        rules=rules,
+        error_correction=get_error_correction_encode(error_correction, repair_symbols),
+        packet_len_format=PACKET_LEN_FORMAT,
+        crc_len_format=CRC_LEN_FORMAT,
+        number_of_chunks_len_format=NUMBER_OF_CHUNKS_LEN_FORMAT,
+        id_len_format=ID_LEN_FORMAT,
+        save_number_of_chunks_in_packet=save_number_of_chunks_in_packet,
+        mode_1_bmp=mode_1_bmp,
+        prepend=prepend,
+        append=append,
+        drop_upper_bound=upper_bound,
+        checksum_len_str=checksum_len_str,
+        xor_by_seed=xor_by_seed,
+        mask_id=mask_id,
+        id_spacing=id_spacing,
+    )
+
+    enc.set_overhead_limit(overhead)
+
+    if priority_first > 0:
+        enc.set_priority_chunks(priority_first)
+
+    return enc
+
+
+def _encode_shard(file_path: Path, shares: int, share: int, padding_seed: int, opts: dict) -> list[str]:
+    """Worker: encode share *share* of *shares* of the packet pool, return FASTA records.
+
+    Packets carry unpicklable state (the distribution's RNG module), so
+    they are rendered to text inside the worker.  Each share draws IDs
+    from its own residue class, so shards never overlap, and pads the
+    last chunk from the common *padding_seed*, so all shards encode the
+    same source chunks.
+    """
+    enc = _make_encoder(file_path, **opts)
+    enc.set_encode_shares(shares, share)
+    enc.set_padding_seed(padding_seed)
+    enc.encode_to_packets()
+    return [enc.get_fasta_record(packet, packet.id, "_RU10") for packet in enc.encodedPackets]
+
+
 def _encode(
     file_path: Path,
     *,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
-    error_correction = nocode,
+    error_correction: str = "nocode",
+    repair_symbols: int = 2,
     insert_header: bool = False,
     save_number_of_chunks_in_packet: bool = False,
     mode_1_bmp: bool = False,
@@ -68,17 +159,25 @@ def _encode(
     p_thr: float = 0.0,
     a: float | None = None,
     thr_0: float | None = None,
-) -> tuple[RU10Encoder, Path]:
+    workers: int = 1,
+) -> tuple[RU10Encoder | None, Path]:
     """Run RU10Encoder and return ``(encoder, fasta_path)``.
 
+    The encoder is ``None`` when *workers* > 1: its packets then live in
+    the worker processes and only the FASTA records come back.
+
     Parameters
     ----------
     file_path : Path
         Path to the binary file to encode.
     chunk_size : int, optional
         Payload size in bytes per packet; defaults to ``DEFAULT_CHUNK_SIZE``.
-    error_correction : callable, optional
-        Error-correction function returned by ``get_error_correction_encode``.
+    error_correction : str, optional
+        Error-correction scheme as accepted by ``get_error_correction_encode``
+        (``nocode``, ``crc``, ``reedsolomon`` or ``dna_reedsolomon``).  It is
+        resolved inside each encoder, so only the name reaches the workers.
+    repair_symbols : int, optional
+        Repair symbols for the chosen error-correction scheme.
     insert_header : bool, optional
         If true, insert a special header oligo.
     save_number_of_chunks_in_packet : bool, optional
@@ -107,54 +206,51 @@ def _encode(
         Bias parameter controlling the rate decay across frames.  It is
         recorded in the configuration file so that decoders can use the
         same value.  If ``None``, the default decoder setting is used.
+    workers : int, optional
+        Number of processes generating packets.  With more than one, each
+        process runs its own encoder for an equal share of the packet
+        target, drawing IDs congruent to its index modulo *workers*, and
+        the FASTA records are concatenated.  Values below 2 encode in this
+        process.
     """
 
-    # determine number of chunks for the given chunk size
-    number_of_chunks = Encoder.get_number_of_chunks_for_file_with_chunk_size(
-        file_path, chunk_size
-    )
-
-    # Instantiate a Raptor distribution.  The distribution itself does not
-    # interpret the bias parameters directly; they will be passed through
-    # to the decoder via the configuration file.
-    dist = RaptorDistribution(number_of_chunks, p_thr=p_thr)
-    rules = FastDNARules()
-
-    # ⚠  RU10Encoder internally does str-concat on its ``file`` attribute,
-    #     so we hand it a plain string instead of a Path.
-    enc = RU10Encoder(
-        str(file_path),
-        number_of_chunks,
-        dist,
-        insert_header=insert_header,
-        pseudo_decoder=None,
-        chunk_size=0,  # let encoder derive from number_of_chunks
-        rules=rules,
+    opts = dict(
+        chunk_size=chunk_size,
         error_correction=error_correction,
-        packet_len_format=PACKET_LEN_FORMAT,
-        crc_len_format=CRC_LEN_FORMAT,
-        number_of_chunks_len_format=NUMBER_OF_CHUNKS_LEN_FORMAT,
-        id_len_format=ID_LEN_FORMAT,
+        repair_symbols=repair_symbols,
+        insert_header=insert_header,
         save_number_of_chunks_in_packet=save_number_of_chunks_in_packet,
         mode_1_bmp=mode_1_bmp,
         prepend=prepend,
         append=append,
-        drop_upper_bound=upper_bound,
+        upper_bound=upper_bound,
+        overhead=overhead,
         checksum_len_str=checksum_len_str,
         xor_by_seed=xor_by_seed,
         mask_id=mask_id,
         id_spacing=id_spacing,
+        priority_first=priority_first,
+        p_thr=p_thr,
     )
+    if workers <= 1:
+        # Encode and write FASTA
+        enc = _make_encoder(file_path, **opts)
+        enc.encode_to_packets()
+        fasta_path = enc.save_packets_fasta(file_ending="_RU10", seed_is_filename=True)
+        return enc, Path(fasta_path)
 
-    enc.set_overhead_limit(overhead)
-
-    if priority_first > 0:
-        enc.set_priority_chunks(priority_first)
+    padding_seed = int.from_bytes(os.urandom(8), "little")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        shards = list(pool.map(_encode_shard, [file_path] * workers, [workers] * workers, range(workers),
+                               [padding_seed] * workers, [opts] * workers))
 
-    # Encode and write FASTA
-    enc.encode_to_packets()
-    fasta_path = enc.save_packets_fasta(file_ending="_RU10", seed_is_filename=True)
-    return enc, Path(fasta_path)
+    # same naming as RU10Encoder.save_packets_fasta(file_ending="_RU10")
+    fasta_path = Path(f"{file_path}_RU10.fasta")
+    with open(fasta_path, "w") as fh:
+        for shard in shards:
+            fh.writelines(shard)
+    print(f"\nSaved result at: {fasta_path}")
+    return None, fasta_path
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -162,6 +258,14 @@ def _encode(
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+def _worker_count(value: str) -> int:
+    """argparse type for ``--workers``: a non-negative integer."""
+    n = int(value)
+    if n < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {n}")
+    return n
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         prog="encode_raw.py",
@@ -199,6 +303,9 @@ def main() -> None:
     parser.add_argument("--priority_first", type=int, default=0, metavar="N",
                         help="Give priority to the first N chunks (0 ⇒ disabled)")
 
+    parser.add_argument("--workers", type=_worker_count, default=1,
+                        help="Processes generating packets in parallel (0 ⇒ os.cpu_count())")
+
     # bias parameters: these are recorded and passed to the decoder via the config
     parser.add_argument("--a", type=float, default=None,
                         help="Bias parameter controlling the maximum singleton rate")
@@ -211,12 +318,11 @@ def main() -> None:
     if not in_path.exists():
         raise FileNotFoundError(in_path)
 
-    ec_fn = get_error_correction_encode(opt.error_correction, opt.repair_symbols)
-
-    enc, fasta_out = _encode(
+    _, fasta_out = _encode(
         in_path,
         chunk_size=opt.chunk_size,
-        error_correction=ec_fn,
+        error_correction=opt.error_correction,
+        repair_symbols=opt.repair_symbols,
         insert_header=opt.insert_header,
         save_number_of_chunks_in_packet=opt.save_number_of_chunks,
         upper_bound=opt.drop_upper_bound,
@@ -229,34 +335,37 @@ def main() -> None:
         priority_first=opt.priority_first,
         a=opt.a,
         thr_0=opt.thr_0,
+        workers=opt.workers or os.cpu_count() or 1,
     )
 
     # Write a configuration file capturing all parameters used during encoding.
-    import configparser
-    _cfg = configparser.ConfigParser()
-    _cfg['EncodingSettings'] = {
-        'input': str(in_path),
-        'out_dir': str(fasta_out.parent),
-        'chunk_size': str(opt.chunk_size),
-        'error_correction': opt.error_correction,
-        'repair_symbols': str(opt.repair_symbols),
-        'overhead': str(opt.overhead),
-        'xor_by_seed': str(opt.xor_by_seed),
-        'mask_id': str(not opt.no_mask_id),
-        'id_spacing': str(opt.id_spacing),
-        'p_thr': str(opt.p_thr),
-        'priority_chunks': str(opt.priority_first),
-        # record bias parameters even if None so decoders know whether defaults apply
-        'a': str(opt.a) if opt.a is not None else '',
-        'thr_0': str(opt.thr_0) if opt.thr_0 is not None else '',
-    }
-    _cfg['Files'] = {
-        'fasta': str(fasta_out),
-        'config': str(fasta_out.parent / 'encoding_config.ini'),
-    }
+    # Laid out exactly as configparser would, without pulling it in for a
+    # dozen static keys.  Bias parameters are recorded even if None (as an
+    # empty value) so decoders know whether defaults apply.
     cfg_path = fasta_out.parent / 'encoding_config.ini'
-    with open(cfg_path, 'w') as _f:
-        _cfg.write(_f)
+    a_str = str(opt.a) if opt.a is not None else ''
+    thr_0_str = str(opt.thr_0) if opt.thr_0 is not None else ''
+    cfg_path.write_text(
+        f"[EncodingSettings]\n"
+        f"input = {in_path}\n"
+        f"out_dir = {fasta_out.parent}\n"
+        f"chunk_size = {opt.chunk_size}\n"
+        f"error_correction = {opt.error_correction}\n"
+        f"repair_symbols = {opt.repair_symbols}\n"
+        f"overhead = {opt.overhead}\n"
+        f"xor_by_seed = {opt.xor_by_seed}\n"
+        f"mask_id = {not opt.no_mask_id}\n"
+        f"id_spacing = {opt.id_spacing}\n"
+        f"p_thr = {opt.p_thr}\n"
+        f"priority_chunks = {opt.priority_first}\n"
+        f"a = {a_str}\n"
+        f"thr_0 = {thr_0_str}\n"
+        f"\n"
+        f"[Files]\n"
+        f"fasta = {fasta_out}\n"
+        f"config = {cfg_path}\n"
+        f"\n"
+    )
 
     print(f"✔ Encoding complete. FASTA saved to: {fasta_out}")
 